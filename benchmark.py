@@ -0,0 +1,83 @@
+import asyncio
+import csv
+import os
+import random
+import tempfile
+import time
+
+import transport
+
+
+def make_clients(count, seed=0):
+    rnd = random.Random(seed)
+    return [
+        transport.Client(f"Client {i}", round(rnd.uniform(1, 500), 2), rnd.random() < 0.1)
+        for i in range(count)
+    ]
+
+
+def make_vehicles(count, seed=0):
+    rnd = random.Random(seed)
+    vehicles = []
+    for _ in range(count):
+        if rnd.random() < 0.5:
+            vehicles.append(transport.Train(rnd.choice([5000, 10000, 20000]), rnd.randint(5, 40)))
+        else:
+            vehicles.append(transport.Airplane(rnd.choice([2000, 4000]), 9000))
+    return vehicles
+
+
+def bench_online(clients_count=10000, vehicles_count=400, vip_reserve=0.1):
+    clients = make_clients(clients_count)
+    packer = transport.OnlinePacker(make_vehicles(vehicles_count), vip_reserve)
+    start = time.perf_counter()
+    for client in clients:
+        packer.place(client)
+    elapsed = time.perf_counter() - start
+
+    offline = transport.TransportCompany("Bench", make_vehicles(vehicles_count), clients)
+    offline.optimize_cargo_distribution()
+    offline_used = sum(1 for v in offline.vehicles if v.clients_list)
+
+    print(f"online: {clients_count / elapsed:.0f} clients/s, vehicles used {packer.vehicles_used()}, "
+          f"rejected {packer.rejected}, offline greedy used {offline_used}, "
+          f"competitive ratio <= {packer.competitive_ratio():.3f} (vs optimum lower bound)")
+
+
+def bench_online_async(clients_count=50000, vehicles_count=2000):
+    async def feed():
+        for client in make_clients(clients_count):
+            yield client
+
+    async def run():
+        company = transport.TransportCompany("Bench", make_vehicles(vehicles_count))
+        start = time.perf_counter()
+        placed = 0
+        async for event in company.astream_cargo_distribution(feed()):
+            placed += event.placed
+        return placed, time.perf_counter() - start
+
+    placed, elapsed = asyncio.run(run())
+    print(f"online async: {clients_count / elapsed:.0f} clients/s, placed {placed}")
+
+
+def bench_import(rows=200000):
+    rnd = random.Random(0)
+    with tempfile.NamedTemporaryFile('w', suffix='.csv', newline='', encoding='utf-8', delete=False) as f:
+        writer = csv.writer(f)
+        writer.writerow(['name', 'cargo_weight', 'is_vip'])
+        for _ in range(rows):
+            writer.writerow(['Иван Петров', round(rnd.uniform(1, 900), 2), rnd.choice(['yes', 'no'])])
+
+    try:
+        company = transport.TransportCompany("Bench")
+        report = transport.import_clients_csv(company, f.name)
+        print(f"import: {report.rows_per_second:.0f} rows/s, added {report.added}, errors {len(report.errors)}")
+    finally:
+        os.remove(f.name)
+
+
+if __name__ == '__main__':
+    bench_online()
+    bench_online_async()
+    bench_import()
@@ -68,9 +68,13 @@ while True:
                 print()
 
         case 6:
+            improve = input("Улучшить локальным поиском? (y/n): ").lower() == "y"
             print("Оптимизация...")
-            company.optimize_cargo_distribution()
+            result = company.optimize_cargo_distribution(improve=improve)
             print("Грузы распределены.")
+            print(result)
+            if result.improvement is not None:
+                print(result.improvement)
 
         case 7:
             print("Выход.")
@@ -3,7 +3,6 @@ import csv
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 from functools import partial
-import re
 import os
 
 from transport.transport_company import TransportCompany
@@ -11,6 +10,8 @@ from transport.client import Client
 from transport.train import Train
 from transport.airplane import Airplane
 from transport.vehicle import Vehicle, CapacityOverloadError
+from transport.validation import validate_name, validate_weight, validate_capacity
+from transport.bulk_import import import_clients_csv, import_vehicles_csv
 
 
 class ToolTip:
@@ -39,35 +40,119 @@ class ToolTip:
             self.tip = None
 
 
-def validate_name(name: str) -> bool:
-    if not isinstance(name, str):
-        return False
-    name = name.strip()
-    if len(name) < 2:
-        return False
-    if not re.match(r'^[A-Za-zА-Яа-яЁё\-\s]+$', name):
-        return False
-    return True
+class TableModel:
+    def __init__(self, columns):
+        self.columns = columns
+        self.rows = []
+        self.order = []
+        self.sort_spec = []
+        self.row_filter = None
+        self._keys = {}
+
+    def set_rows(self, rows):
+        self.rows = list(rows)
+        self._keys.clear()
+        self.update_order()
+
+    def set_filter(self, row_filter):
+        self.row_filter = row_filter
+        self.update_order()
+
+    def sort_keys(self, col):
+        keys = self._keys.get(col)
+        if keys is None:
+            key = self.columns[col][1]
+            keys = [key(r) for r in self.rows]
+            self._keys[col] = keys
+        return keys
+
+    def toggle_sort(self, col):
+        if self.sort_spec and self.sort_spec[0][0] == col:
+            self.sort_spec[0] = (col, not self.sort_spec[0][1])
+        else:
+            self.sort_spec = [(col, False)] + [s for s in self.sort_spec if s[0] != col]
+        self.update_order()
 
+    def update_order(self):
+        if self.row_filter is None:
+            order = list(range(len(self.rows)))
+        else:
+            order = [i for i, r in enumerate(self.rows) if self.row_filter(r)]
+        for col, descending in reversed(self.sort_spec):
+            order.sort(key=self.sort_keys(col).__getitem__, reverse=descending)
+        self.order = order
+
+    def values(self, idx):
+        row = self.rows[idx]
+        return tuple(display(row) for display, _ in self.columns.values())
+
+
+class TableView:
+    def __init__(self, parent, model, headings):
+        self.model = model
+        self.headings = headings
+        self.shown = []
+
+        self.scrollbar = ttk.Scrollbar(parent, orient='vertical')
+        self.scrollbar.pack(side='right', fill='y')
+        self.tree = ttk.Treeview(parent, columns=tuple(model.columns), show='headings', selectmode='browse',
+                                 yscrollcommand=self.on_scroll)
+        self.scrollbar.config(command=self.tree.yview)
+        for col, text in headings.items():
+            self.tree.heading(col, text=text, command=partial(self.sort, col))
+            self.tree.column(col, anchor='center')
+        self.tree.pack(fill='both', expand=True)
+
+    def sort(self, col):
+        selected = [self.model.order[int(iid)] for iid in self.tree.selection()]
+        self.model.toggle_sort(col)
+        self.update_headings()
+
+        # Строки — это слоты позиций, поэтому выделение переносится вслед за записью
+        self.tree.selection_set([])
+        if selected:
+            pos = str(self.model.order.index(selected[0]))
+            self.tree.selection_set(pos)
+            self.tree.see(pos)
+        self.render_visible()
+
+    def update_headings(self):
+        spec = dict(self.model.sort_spec[:1])
+        for col, text in self.headings.items():
+            if col in spec:
+                text += ' ▼' if spec[col] else ' ▲'
+            self.tree.heading(col, text=text)
+
+    def render(self):
+        n = len(self.model.order)
+        children = self.tree.get_children('')
+        if len(children) > n:
+            self.tree.delete(*children[n:])
+        for pos in range(len(children), n):
+            self.tree.insert('', 'end', iid=str(pos))
+        self.shown = [None] * n
+        self.render_visible()
+
+    def render_visible(self):
+        n = len(self.shown)
+        if not n:
+            return
+        first, last = self.tree.yview()
+        start = int(first * n)
+        stop = min(n, int(last * n) + 2)
+        for pos in range(start, stop):
+            idx = self.model.order[pos]
+            if self.shown[pos] != idx:
+                self.tree.item(str(pos), text=str(idx), values=self.model.values(idx))
+                self.shown[pos] = idx
 
-def validate_weight(w: str) -> tuple[bool, float]:
-    try:
-        val = float(w)
-    except Exception:
-        return False, 0.0
-    if val <= 0 or val > 10000:
-        return False, val
-    return True, val
+    def on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.render_visible()
 
 
-def validate_capacity(c: str) -> tuple[bool, float]:
-    try:
-        val = float(c)
-    except Exception:
-        return False, 0.0
-    if val < 0:
-        return False, val
-    return True, val
+def vehicle_type_label(vehicle) -> str:
+    return 'Поезд' if isinstance(vehicle, Train) else 'Самолёт' if isinstance(vehicle, Airplane) else 'Транспорт'
 
 
 class ClientDialog(tk.Toplevel):
@@ -246,6 +331,9 @@ class TransportApp(tk.Tk):
         file_menu.add_command(label='Сохранить состояние...', command=self.save_state)
         file_menu.add_command(label='Загрузить состояние...', command=self.load_state)
         file_menu.add_separator()
+        file_menu.add_command(label='Импорт клиентов из CSV...', command=partial(self.import_csv, 'clients'))
+        file_menu.add_command(label='Импорт транспорта из CSV...', command=partial(self.import_csv, 'vehicles'))
+        file_menu.add_separator()
         file_menu.add_command(label='Выход', command=self.quit)
         menubar.add_cascade(label='Файл', menu=file_menu)
 
@@ -275,44 +363,47 @@ class TransportApp(tk.Tk):
         distribute_btn.pack(side='left', padx=6)
         ToolTip(distribute_btn, 'Оптимизировать распределение грузов')
 
+        self.improve_var = tk.BooleanVar(value=False)
+        improve_check = tk.Checkbutton(frame, text='Улучшать (1 c)', variable=self.improve_var)
+        improve_check.pack(side='left', padx=6)
+        ToolTip(improve_check, 'После распределения попытаться освободить малозагруженный транспорт')
+
     def create_tables(self):
         paned = ttk.Panedwindow(self, orient='horizontal')
         paned.pack(fill='both', expand=True, padx=6, pady=6)
 
         client_frame = ttk.Labelframe(paned, text='Клиенты')
-        self.client_tree = ttk.Treeview(client_frame, columns=('name','weight','vip'), show='headings', selectmode='browse')
-        for col, text in [('name','Имя'),('weight','Вес (кг)'),('vip','VIP')]:
-            self.client_tree.heading(col, text=text, command=partial(self.sort_tree, self.client_tree, col))
-            self.client_tree.column(col, anchor='center')
-        self.client_tree.pack(fill='both', expand=True)
+        self.client_model = TableModel({
+            'name': (lambda c: c.name, lambda c: c.name.casefold()),
+            'weight': (lambda c: c.cargo_weight, lambda c: float(c.cargo_weight)),
+            'vip': (lambda c: str(c.is_vip), lambda c: c.is_vip),
+        })
+        self.client_table = TableView(client_frame, self.client_model,
+                                      {'name': 'Имя', 'weight': 'Вес (кг)', 'vip': 'VIP'})
+        self.client_tree = self.client_table.tree
         self.client_tree.bind('<Double-1>', self.on_client_double)
         paned.add(client_frame, weight=1)
 
         vehicle_frame = ttk.Labelframe(paned, text='Транспорт')
-        self.vehicle_tree = ttk.Treeview(vehicle_frame, columns=('id','type','capacity','load'), show='headings', selectmode='browse')
-        for col, text in [('id','ID'),('type','Тип'),('capacity','Вместимость'),('load','Текущая загрузка')]:
-            self.vehicle_tree.heading(col, text=text, command=partial(self.sort_tree, self.vehicle_tree, col))
-            self.vehicle_tree.column(col, anchor='center')
-        self.vehicle_tree.pack(fill='both', expand=True)
+        self.vehicle_model = TableModel({
+            'id': (lambda v: str(v.vehicle_id), lambda v: str(v.vehicle_id)),
+            'type': (vehicle_type_label, vehicle_type_label),
+            'capacity': (lambda v: v.capacity, lambda v: float(v.capacity)),
+            'load': (lambda v: v.current_load, lambda v: float(v.current_load)),
+        })
+        self.vehicle_table = TableView(vehicle_frame, self.vehicle_model,
+                                       {'id': 'ID', 'type': 'Тип', 'capacity': 'Вместимость', 'load': 'Текущая загрузка'})
+        self.vehicle_tree = self.vehicle_table.tree
         self.vehicle_tree.bind('<Double-1>', self.on_vehicle_double)
         paned.add(vehicle_frame, weight=2)
 
         search_frame = tk.Frame(client_frame)
-        search_frame.pack(side='bottom', fill='x')
+        search_frame.pack(side='bottom', fill='x', before=self.client_table.scrollbar)
         tk.Label(search_frame, text='Поиск по имени:').pack(side='left')
         self.search_var = tk.StringVar()
         search_entry = tk.Entry(search_frame, textvariable=self.search_var)
         search_entry.pack(side='left', padx=6)
-        search_entry.bind('<KeyRelease>', lambda e: self.refresh_clients())
-
-    def sort_tree(self, tree, col):
-        data = [(tree.set(k, col), k) for k in tree.get_children('')]
-        try:
-            data.sort(key=lambda t: float(t[0]))
-        except Exception:
-            data.sort(key=lambda t: t[0])
-        for index, (_, k) in enumerate(data):
-            tree.move(k, '', index)
+        search_entry.bind('<KeyRelease>', lambda e: self.filter_clients())
 
     def add_client(self):
         dlg = ClientDialog(self, title='Добавить клиента')
@@ -340,7 +431,7 @@ class TransportApp(tk.Tk):
         dlg = ClientDialog(self, title='Редактировать клиента', client=client)
         self.wait_window(dlg)
         if dlg.result:
-            self.company.clients[idx] = dlg.result
+            self.company.replace_client(client, dlg.result)
             self.status('Клиент обновлён')
             self.refresh_clients()
 
@@ -363,11 +454,13 @@ class TransportApp(tk.Tk):
         if self.client_tree.selection():
             sel = self.client_tree.selection()[0]
             idx = int(self.client_tree.item(sel, 'text'))
-            name = self.company.clients[idx].name
+            client = self.company.clients[idx]
+            name = client.name
             if messagebox.askyesno('Подтвердите удаление', f'Удалить клиента "{name}"?'):
-                del self.company.clients[idx]
+                self.company.remove_client(client)
                 self.status(f'Клиент {name} удалён')
                 self.refresh_clients()
+                self.refresh_vehicles()
             return
         if self.vehicle_tree.selection():
             sel = self.vehicle_tree.selection()[0]
@@ -381,44 +474,35 @@ class TransportApp(tk.Tk):
         messagebox.showinfo('Нет выбора', 'Сначала выберите запись в таблице.')
 
     def refresh_clients(self):
+        self.client_model.set_rows(self.company.clients)
+        self.filter_clients()
+
+    def filter_clients(self):
         q = self.search_var.get().strip().lower()
-        for i in self.client_tree.get_children(''):
-            self.client_tree.delete(i)
-        for idx, c in enumerate(self.company.clients):
-            if q and q not in c.name.lower():
-                continue
-            self.client_tree.insert('', 'end', text=str(idx), values=(c.name, c.cargo_weight, str(c.is_vip)))
+        self.client_model.set_filter((lambda c: q in c.name.lower()) if q else None)
+        self.client_table.render()
 
     def refresh_vehicles(self):
-        for i in self.vehicle_tree.get_children(''):
-            self.vehicle_tree.delete(i)
-        for idx, v in enumerate(self.company.vehicles):
-            typ = 'Поезд' if isinstance(v, Train) else 'Самолёт' if isinstance(v, Airplane) else 'Транспорт'
-            self.vehicle_tree.insert('', 'end', text=str(idx), values=(str(v.vehicle_id), typ, v.capacity, v.current_load))
+        self.vehicle_model.set_rows(self.company.vehicles)
+        self.vehicle_table.render()
 
     def distribute(self):
         if not self.company.clients or not self.company.vehicles:
             messagebox.showwarning('Ошибка', 'Нужно как минимум один клиент и один транспорт для распределения.')
             return
-        for v in self.company.vehicles:
-            v.clients_list = []
-            v.current_load = 0
         try:
-            self.company.optimize_cargo_distribution()
-            self.status('Распределение выполнено')
+            result = self.company.optimize_cargo_distribution(improve=self.improve_var.get())
         except Exception as e:
             messagebox.showerror('Ошибка при распределении', str(e))
             self.status('Ошибка')
             return
-        result = []
-        for v in self.company.vehicles:
-            result.append({
-                'vehicle_id': str(v.vehicle_id),
-                'type': 'Поезд' if isinstance(v, Train) else 'Самолёт' if isinstance(v, Airplane) else 'Транспорт',
-                'capacity': v.capacity,
-                'current_load': v.current_load,
-                'clients': [{'name': c.name, 'cargo_weight': c.cargo_weight, 'vip': c.is_vip} for c in v.clients_list]
-            })
+        text = 'Распределение выполнено'
+        if result.improvement is not None:
+            text += (f', освобождено транспорта: {result.improvement.vehicles_removed} '
+                     f'за {result.improvement.elapsed:.2f} с')
+        if self.last_distribution is not None:
+            text += f', изменено назначений: {len(self.last_distribution.diff(result))}'
+        self.status(text)
         self.last_distribution = result
         self.show_distribution_modal(result)
         self.refresh_vehicles()
@@ -435,7 +519,7 @@ class TransportApp(tk.Tk):
             tree.column(col, anchor='w')
         tree.pack(fill='both', expand=True)
 
-        for r in result:
+        for r in result.records(vehicle_type_label):
             clients_str = '; '.join([f"{c['name']}({c['cargo_weight']})" for c in r['clients']])
             tree.insert('', 'end', values=(r['vehicle_id'], r['type'], r['capacity'], r['current_load'], clients_str))
 
@@ -445,7 +529,7 @@ class TransportApp(tk.Tk):
         save_btn.pack(side='right', padx=6)
 
     def export_result(self):
-        if not self.last_distribution:
+        if self.last_distribution is None:
             messagebox.showwarning('Нет данных', 'Сначала выполните распределение грузов.')
             return
         ftypes = [('JSON file', '*.json'), ('CSV file', '*.csv')]
@@ -455,12 +539,12 @@ class TransportApp(tk.Tk):
         try:
             if path.lower().endswith('.json'):
                 with open(path, 'w', encoding='utf-8') as f:
-                    json.dump(self.last_distribution, f, ensure_ascii=False, indent=2)
+                    json.dump(list(self.last_distribution.records(vehicle_type_label)), f, ensure_ascii=False, indent=2)
             else:
                 with open(path, 'w', encoding='utf-8', newline='') as f:
                     writer = csv.writer(f)
                     writer.writerow(['vehicle_id','type','capacity','current_load','clients'])
-                    for r in self.last_distribution:
+                    for r in self.last_distribution.records(vehicle_type_label):
                         writer.writerow([r['vehicle_id'], r['type'], r['capacity'], r['current_load'], json.dumps(r['clients'], ensure_ascii=False)])
             self.status(f'Результат экспортирован в {os.path.basename(path)}')
             messagebox.showinfo('Экспорт', 'Результат успешно сохранён.')
@@ -509,8 +593,8 @@ class TransportApp(tk.Tk):
                 else:
                     from transport.vehicle import Vehicle as V
                     vehicles.append(V(v.get('capacity',0)))
-            self.company.clients = clients
-            self.company.vehicles = vehicles
+            self.company = TransportCompany(self.company.name, vehicles, clients,
+                                            priority_tiers=self.company.intake.tiers)
             self.refresh_clients()
             self.refresh_vehicles()
             self.status('Состояние загружено')
@@ -519,6 +603,30 @@ class TransportApp(tk.Tk):
             messagebox.showerror('Ошибка', str(e))
             self.status('Ошибка при загрузке')
 
+    def import_csv(self, kind):
+        path = filedialog.askopenfilename(filetypes=[('CSV','*.csv')])
+        if not path:
+            return
+        try:
+            if kind == 'clients':
+                report = import_clients_csv(self.company, path)
+                self.refresh_clients()
+            else:
+                report = import_vehicles_csv(self.company, path)
+                self.refresh_vehicles()
+        except Exception as e:
+            messagebox.showerror('Ошибка импорта', str(e))
+            self.status('Ошибка при импорте')
+            return
+        text = (f'Строк: {report.rows}\nДобавлено: {report.added}\nОшибок: {len(report.errors)}\n'
+                f'Скорость: {report.rows_per_second:.0f} строк/с')
+        if report.errors:
+            text += '\n\n' + '\n'.join(f'Строка {line}: {msg}' for line, msg in report.errors[:10])
+            if len(report.errors) > 10:
+                text += f'\n... и ещё {len(report.errors) - 10}'
+        self.status(f'Импортировано {report.added} записей ({report.rows_per_second:.0f} строк/с)')
+        messagebox.showinfo('Импорт', text)
+
     def show_about(self):
         about_text = (
             'Описание: GUI для управления транспортной компанией и распределения грузов.'
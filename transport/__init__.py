@@ -3,6 +3,12 @@ from .vehicle import Vehicle
 from .train import Train
 from .transport_company import TransportCompany
 from .airplane import Airplane
+from .intake_queue import IntakeQueue
+from .online_packing import OnlinePacker, PlacementEvent
+from .distribution_result import DistributionResult
+from .local_search import ImprovementReport, improve_distribution, improve_result
+from .bulk_import import ImportReport, import_clients_csv, import_vehicles_csv
+from .fleet_sizing import FleetConfiguration, sweep_fleet_sizes
 
 
 __all__ = [
@@ -10,5 +16,17 @@ __all__ = [
     'Vehicle',
     'Train',
     'Airplane',
-    'TransportCompany'
+    'TransportCompany',
+    'IntakeQueue',
+    'OnlinePacker',
+    'PlacementEvent',
+    'ImprovementReport',
+    'improve_distribution',
+    'improve_result',
+    'DistributionResult',
+    'ImportReport',
+    'import_clients_csv',
+    'import_vehicles_csv',
+    'FleetConfiguration',
+    'sweep_fleet_sizes'
 ]
\ No newline at end of file
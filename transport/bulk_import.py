@@ -0,0 +1,198 @@
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .client import Client
+from .train import Train
+from .airplane import Airplane
+from .validation import validate_name, validate_weight, validate_capacity
+
+
+CLIENT_COLUMNS = ('name', 'cargo_weight', 'is_vip')
+VEHICLE_COLUMNS = ('type', 'capacity', 'number_of_cars', 'max_altitude')
+
+TRUE_VALUES = {'1', 'true', 'yes', 'y', 'да', 'д'}
+FALSE_VALUES = {'', '0', 'false', 'no', 'n', 'нет', 'н'}
+
+
+class ImportReport:
+    def __init__(self, rows, added, errors, elapsed):
+        self.rows = rows
+        self.added = added
+        self.errors = errors
+        self.elapsed = elapsed
+
+    @property
+    def rows_per_second(self):
+        if self.elapsed <= 0:
+            return float(self.rows)
+        return self.rows / self.elapsed
+
+    def __str__(self):
+        return (
+            f"Rows: {self.rows}\n"
+            f"Added: {self.added}\n"
+            f"Errors: {len(self.errors)}\n"
+            f"Throughput: {self.rows_per_second:.0f} rows/s"
+        )
+
+
+def _field(row, columns, name):
+    i = columns.get(name)
+    if i is None or i >= len(row):
+        return ''
+    return row[i].strip()
+
+
+def _parse_client(row, columns):
+    name = _field(row, columns, 'name')
+    if not validate_name(name):
+        raise ValueError("имя: только буквы и минимум 2 символа")
+
+    ok_weight, weight = validate_weight(_field(row, columns, 'cargo_weight'))
+    if not ok_weight:
+        raise ValueError("вес должен быть положительным числом не более 10000 кг")
+
+    vip = _field(row, columns, 'is_vip').lower()
+    if vip not in TRUE_VALUES and vip not in FALSE_VALUES:
+        raise ValueError(f"некорректный флаг VIP: {vip}")
+
+    return Client(name, weight, vip in TRUE_VALUES)
+
+
+def _parse_vehicle(row, columns):
+    ok_cap, cap = validate_capacity(_field(row, columns, 'capacity'))
+    if not ok_cap:
+        raise ValueError("вместимость должна быть числом >= 0")
+
+    kind = _field(row, columns, 'type').lower()
+    if kind in ('train', 'поезд'):
+        try:
+            cars = int(_field(row, columns, 'number_of_cars') or 0)
+        except ValueError:
+            raise ValueError("число вагонов должно быть неотрицательным целым")
+        return Train(cap, cars)
+
+    if kind in ('airplane', 'самолёт', 'самолет'):
+        try:
+            alt = int(_field(row, columns, 'max_altitude'))
+        except ValueError:
+            raise ValueError("максимальная высота должна быть положительным целым")
+        return Airplane(cap, alt)
+
+    raise ValueError(f"неизвестный тип транспорта: {kind}")
+
+
+PARSERS = {
+    'clients': _parse_client,
+    'vehicles': _parse_vehicle,
+}
+
+
+def _parse_chunk(path, start, end, first, kind, columns):
+    parse = PARSERS[kind]
+    with open(path, 'rb') as f:
+        if first:
+            f.seek(start)
+        else:
+            # Строка принадлежит чанку, в котором она начинается
+            f.seek(start - 1)
+            f.readline()
+
+        lines = []
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            lines.append(line)
+
+    # Чанки режутся по физическим строкам, поэтому поля в кавычках с переводом
+    # строки не поддерживаются: такая запись попадает в ошибки построчно
+    objects = []
+    errors = []
+    for i, line in enumerate(lines):
+        try:
+            row = next(csv.reader([line.decode('utf-8')], strict=True), [])
+            if not row or not any(cell.strip() for cell in row):
+                continue
+            objects.append(parse(row, columns))
+        except UnicodeDecodeError:
+            errors.append((i, "строка не в кодировке UTF-8"))
+        except csv.Error:
+            errors.append((i, "некорректная строка CSV (многострочные поля не поддерживаются)"))
+        except (TypeError, ValueError) as e:
+            errors.append((i, str(e)))
+    return len(lines), objects, errors
+
+
+def _byte_ranges(data_start, size, chunk_bytes):
+    ranges = []
+    start = data_start
+    while start < size:
+        end = min(size, start + chunk_bytes)
+        ranges.append((start, end, start == data_start))
+        start = end
+    return ranges
+
+
+def _read_header(path, expected):
+    with open(path, 'rb') as f:
+        header = f.readline()
+        data_start = f.tell()
+
+    names = next(csv.reader([header.decode('utf-8-sig')]), [])
+    columns = {name.strip().lower(): i for i, name in enumerate(names)}
+    missing = [name for name in expected if name not in columns]
+    return columns, data_start, missing
+
+
+def parse_csv(path, kind, max_workers=None, chunk_bytes=4 * 1024 * 1024):
+    if kind not in PARSERS:
+        raise ValueError("kind must be 'clients' or 'vehicles'")
+
+    if not isinstance(chunk_bytes, int):
+        raise TypeError("chunk_bytes must be int")
+
+    if chunk_bytes <= 0:
+        raise ValueError("chunk_bytes must be positive")
+
+    expected = CLIENT_COLUMNS[:2] if kind == 'clients' else VEHICLE_COLUMNS[:2]
+    columns, data_start, missing = _read_header(path, expected)
+    if missing:
+        raise ValueError(f"missing CSV columns: {', '.join(missing)}")
+
+    ranges = _byte_ranges(data_start, os.path.getsize(path), chunk_bytes)
+    if len(ranges) <= 1 or max_workers == 1:
+        chunks = [_parse_chunk(path, start, end, first, kind, columns) for start, end, first in ranges]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(_parse_chunk, path, start, end, first, kind, columns)
+                for start, end, first in ranges
+            ]
+            chunks = [future.result() for future in futures]
+
+    rows = 0
+    objects = []
+    errors = []
+    for count, chunk_objects, chunk_errors in chunks:
+        objects.extend(chunk_objects)
+        # Заголовок — строка 1, данные начинаются со строки 2
+        errors.extend((rows + i + 2, message) for i, message in chunk_errors)
+        rows += count
+    return rows, objects, errors
+
+
+def import_clients_csv(company, path, max_workers=None, chunk_bytes=4 * 1024 * 1024):
+    start = time.perf_counter()
+    rows, clients, errors = parse_csv(path, 'clients', max_workers, chunk_bytes)
+    company.add_clients(clients)
+    return ImportReport(rows, len(clients), errors, time.perf_counter() - start)
+
+
+def import_vehicles_csv(company, path, max_workers=None, chunk_bytes=4 * 1024 * 1024):
+    start = time.perf_counter()
+    rows, vehicles, errors = parse_csv(path, 'vehicles', max_workers, chunk_bytes)
+    company.add_vehicles(vehicles)
+    return ImportReport(rows, len(vehicles), errors, time.perf_counter() - start)
@@ -0,0 +1,152 @@
+from array import array
+
+from .vehicle import Vehicle
+
+
+def _positions(clients):
+    # Один и тот же клиент может стоять в книге несколько раз — каждому
+    # вхождению своя позиция, выдаются по порядку через pop()
+    index = {}
+    for i, client in enumerate(clients):
+        index.setdefault(id(client), []).append(i)
+    for positions in index.values():
+        positions.reverse()
+    return index
+
+
+class DistributionResult:
+    def __init__(self, clients, vehicles, assignment, base_loads=None):
+        if not isinstance(vehicles, (list, tuple)):
+            raise TypeError("vehicles must be a list or tuple")
+
+        for vehicle in vehicles:
+            if not isinstance(vehicle, Vehicle):
+                raise TypeError("vehicles must contain Vehicle instances")
+
+        if len(assignment) != len(clients):
+            raise ValueError("assignment must have an entry per client")
+
+        if base_loads is not None and len(base_loads) != len(vehicles):
+            raise ValueError("base_loads must have an entry per vehicle")
+
+        self.clients = tuple(clients)
+        self.vehicles = tuple(vehicles)
+        self.assignment = assignment if isinstance(assignment, array) else array('l', assignment)
+        self.base_loads = tuple(base_loads) if base_loads is not None else (0,) * len(self.vehicles)
+        self.improvement = None
+        self._offsets = None
+        self._members = None
+
+    @classmethod
+    def from_bins(cls, clients, vehicles, bins, base_loads=None):
+        index = _positions(clients)
+        assignment = array('l', [-1]) * len(clients)
+        for v, members in enumerate(bins):
+            for client in members:
+                assignment[index[id(client)].pop()] = v
+        return cls(clients, vehicles, assignment, base_loads)
+
+    def _build(self):
+        # CSR: клиенты сгруппированы по транспорту, offsets[v]..offsets[v+1]
+        counts = [0] * (len(self.vehicles) + 1)
+        for v in self.assignment:
+            if v >= 0:
+                counts[v + 1] += 1
+
+        offsets = array('l', counts)
+        for v in range(1, len(offsets)):
+            offsets[v] += offsets[v - 1]
+
+        members = array('l', [0]) * offsets[-1]
+        cursor = list(offsets[:-1])
+        for i, v in enumerate(self.assignment):
+            if v >= 0:
+                members[cursor[v]] = i
+                cursor[v] += 1
+
+        self._offsets = offsets
+        self._members = members
+
+    @property
+    def offsets(self):
+        if self._offsets is None:
+            self._build()
+        return self._offsets
+
+    @property
+    def members(self):
+        if self._members is None:
+            self._build()
+        return self._members
+
+    def vehicle_view(self, v):
+        offsets = self.offsets
+        return memoryview(self.members)[offsets[v]:offsets[v + 1]]
+
+    def vehicle_clients(self, v):
+        return [self.clients[i] for i in self.vehicle_view(v)]
+
+    def vehicle_load(self, v):
+        return self.base_loads[v] + sum(self.clients[i].cargo_weight for i in self.vehicle_view(v))
+
+    def unassigned(self):
+        return [c for c, v in zip(self.clients, self.assignment) if v < 0]
+
+    def vehicles_used(self):
+        offsets = self.offsets
+        return sum(
+            1 for v in range(len(self.vehicles))
+            if offsets[v + 1] > offsets[v] or self.base_loads[v] > 0
+        )
+
+    def diff(self, other):
+        if not isinstance(other, DistributionResult):
+            raise TypeError("other must be instance of DistributionResult")
+
+        def vehicle(result, v):
+            return result.vehicles[v] if v >= 0 else None
+
+        changes = []
+        if other.clients == self.clients:
+            for i, (old, new) in enumerate(zip(self.assignment, other.assignment)):
+                if vehicle(self, old) is not vehicle(other, new):
+                    changes.append((self.clients[i], vehicle(self, old), vehicle(other, new)))
+            return changes
+
+        index = _positions(other.clients)
+        for i, client in enumerate(self.clients):
+            positions = index.get(id(client))
+            j = positions.pop() if positions else None
+            old = vehicle(self, self.assignment[i])
+            new = vehicle(other, other.assignment[j]) if j is not None else None
+            if old is not new:
+                changes.append((client, old, new))
+        for positions in index.values():
+            for j in positions:
+                new = vehicle(other, other.assignment[j])
+                if new is not None:
+                    changes.append((other.clients[j], None, new))
+        return changes
+
+    def apply(self):
+        for v, vehicle in enumerate(self.vehicles):
+            vehicle.clients_list = self.vehicle_clients(v)
+            vehicle.current_load = self.base_loads[v] + sum(c.cargo_weight for c in vehicle.clients_list)
+
+    def records(self, type_label=None):
+        for v, vehicle in enumerate(self.vehicles):
+            clients = [self.clients[i] for i in self.vehicle_view(v)]
+            yield {
+                'vehicle_id': str(vehicle.vehicle_id),
+                'type': type_label(vehicle) if type_label else type(vehicle).__name__,
+                'capacity': vehicle.capacity,
+                'current_load': self.base_loads[v] + sum(c.cargo_weight for c in clients),
+                'clients': [{'name': c.name, 'cargo_weight': c.cargo_weight, 'vip': c.is_vip} for c in clients],
+            }
+
+    def __str__(self):
+        return (
+            f"Clients: {len(self.clients)}\n"
+            f"Vehicles used: {self.vehicles_used()}\n"
+            f"Unassigned: {sum(1 for v in self.assignment if v < 0)}"
+        )
@@ -0,0 +1,225 @@
+import itertools
+import os
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .client import Client
+from .intake_queue import IntakeQueue
+from .vehicle import Vehicle
+
+
+class FleetConfiguration:
+    def __init__(self, counts, vehicles_used, spare_capacity):
+        self.counts = counts
+        self.vehicles_used = vehicles_used
+        self.spare_capacity = spare_capacity
+
+    def __str__(self):
+        return (
+            f"Counts: {list(self.counts)}\n"
+            f"Vehicles used: {self.vehicles_used}\n"
+            f"Spare capacity: {self.spare_capacity}"
+        )
+
+
+_shared_weights = None
+_shared_block = None
+_prefix_cache = {}
+_prefix_lengths = set()
+
+
+def _attach_weights(block_name, count):
+    global _shared_weights, _shared_block
+    _shared_block = shared_memory.SharedMemory(name=block_name)
+    _shared_weights = _shared_block.buf[:count * 8].cast('d')
+
+
+def _first_fit(weights, capacities):
+    size = 1
+    while size < len(capacities):
+        size *= 2
+
+    tree = [-1.0] * (2 * size)
+    tree[size:size + len(capacities)] = capacities
+    for i in range(size - 1, 0, -1):
+        tree[i] = max(tree[2 * i], tree[2 * i + 1])
+
+    loaded = [False] * len(capacities)
+    for w in weights:
+        if tree[1] < w:
+            return None
+
+        i = 1
+        while i < size:
+            i *= 2
+            if tree[i] < w:
+                i += 1
+
+        tree[i] -= w
+        loaded[i - size] = True
+        i //= 2
+        while i:
+            tree[i] = max(tree[2 * i], tree[2 * i + 1])
+            i //= 2
+
+    used = [c for c, flag in zip(capacities, loaded) if flag]
+    last = max(i for i, flag in enumerate(loaded) if flag) if used else -1
+    return len(used), sum(used), last + 1
+
+
+def _evaluate_chunk(chunk, total_weight):
+    results = []
+    for counts, capacities in chunk:
+        # Первый подходящий транспорт всегда левее последнего занятого,
+        # поэтому результат зависит только от этого префикса вместимостей
+        packed = None
+        for length in _prefix_lengths:
+            if length <= len(capacities):
+                packed = _prefix_cache.get(tuple(capacities[:length]))
+                if packed is not None:
+                    break
+
+        if packed is None:
+            packed = _first_fit(_shared_weights, capacities)
+            if packed is None:
+                continue
+            _prefix_lengths.add(packed[2])
+            _prefix_cache[tuple(capacities[:packed[2]])] = packed
+
+        used, used_capacity, _ = packed
+        results.append((counts, used, used_capacity - total_weight))
+    return results
+
+
+def _passes_lower_bounds(capacities, heavy_first, prefix):
+    if capacities[-1] < heavy_first[0]:
+        return False
+
+    if prefix[-1] > sum(capacities):
+        return False
+
+    # Грузы тяжелее c могут встать только в транспорт вместимостью больше c
+    above = sum(capacities)
+    i = 0
+    while i < len(capacities):
+        c = capacities[i]
+        while i < len(capacities) and capacities[i] == c:
+            above -= capacities[i]
+            i += 1
+        heavier = bisect_left(heavy_first, -c, key=lambda w: -w)
+        if prefix[heavier] > above:
+            return False
+
+    return True
+
+
+def pareto_front(configurations):
+    best = {}
+    for conf in configurations:
+        point = (conf.vehicles_used, conf.spare_capacity)
+        if point not in best or sum(conf.counts) < sum(best[point].counts):
+            best[point] = conf
+
+    front = []
+    min_spare = None
+    for point in sorted(best):
+        if min_spare is None or point[1] < min_spare:
+            front.append(best[point])
+            min_spare = point[1]
+    return front
+
+
+def sweep_fleet_sizes(clients, vehicle_types, counts, max_workers=None, chunk_size=64, priority_tiers=None):
+    if not isinstance(clients, (list, tuple)):
+        raise TypeError("clients must be a list or tuple")
+
+    if not isinstance(vehicle_types, (list, tuple)):
+        raise TypeError("vehicle_types must be a list or tuple")
+
+    for client in clients:
+        if not isinstance(client, Client):
+            raise TypeError("clients must contain Client instances")
+
+    for vehicle in vehicle_types:
+        if not isinstance(vehicle, Vehicle):
+            raise TypeError("vehicle_types must contain Vehicle instances")
+
+    if not clients:
+        raise ValueError("clients must not be empty")
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    # Тот же порядок, что и у optimize_cargo_distribution с такими же уровнями
+    intake = IntakeQueue(priority_tiers)
+    for client in clients:
+        intake.push(client)
+    order = intake.ordered()
+    weights = array('d', (c.cargo_weight for c in order))
+    total_weight = sum(weights)
+
+    heavy_first = sorted(weights, reverse=True)
+    prefix = [0.0]
+    for w in heavy_first:
+        prefix.append(prefix[-1] + w)
+
+    if isinstance(counts, (list, tuple)) and all(isinstance(c, range) for c in counts):
+        if len(counts) != len(vehicle_types):
+            raise ValueError("counts must contain a range per vehicle type")
+        # Самый вместительный тип перебирается во внутреннем цикле, чтобы
+        # соседние конфигурации в одном чанке делили общий префикс
+        axes = sorted(range(len(counts)), key=lambda i: vehicle_types[i].capacity)
+        grid = (
+            tuple(combo[axes.index(i)] for i in range(len(counts)))
+            for combo in itertools.product(*(counts[i] for i in axes))
+        )
+    else:
+        grid = counts
+
+    def candidates():
+        seen = set()
+        for combo in grid:
+            if len(combo) != len(vehicle_types):
+                raise ValueError("every configuration needs a count per vehicle type")
+            capacities = []
+            for vehicle, n in zip(vehicle_types, combo):
+                capacities.extend([vehicle.capacity] * n)
+            if not capacities:
+                continue
+            capacities.sort()
+            signature = tuple(capacities)
+            if signature in seen:
+                continue
+            seen.add(signature)
+            if _passes_lower_bounds(capacities, heavy_first, prefix):
+                yield tuple(combo), capacities
+
+    block = shared_memory.SharedMemory(create=True, size=max(len(weights) * 8, 1))
+    try:
+        block.buf[:len(weights) * 8] = weights.tobytes()
+
+        evaluated = []
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach_weights,
+            initargs=(block.name, len(weights)),
+        ) as pool:
+            pending = []
+            stream = candidates()
+            while True:
+                chunk = list(itertools.islice(stream, chunk_size))
+                if not chunk:
+                    break
+                pending.append(pool.submit(_evaluate_chunk, chunk, total_weight))
+                if len(pending) >= workers * 4:
+                    evaluated.extend(pending.pop(0).result())
+            for future in pending:
+                evaluated.extend(future.result())
+    finally:
+        block.close()
+        block.unlink()
+
+    return pareto_front([FleetConfiguration(*r) for r in evaluated])
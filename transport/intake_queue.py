@@ -0,0 +1,107 @@
+import heapq
+import itertools
+from bisect import bisect_right
+
+from .client import Client
+
+
+DEFAULT_TIERS = (lambda c: c.is_vip,)
+
+
+class IntakeQueue:
+    def __init__(self, tiers=None):
+        self.tiers = tuple(tiers) if tiers is not None else DEFAULT_TIERS
+        for tier in self.tiers:
+            if not callable(tier):
+                raise TypeError("tiers must contain callables")
+
+        self._heap = []
+        self._settled = []
+        self._settled_clients = []
+        self._entries = {}
+        self._order = None
+        self._seq = itertools.count()
+        self._size = 0
+        self._dead = 0
+
+    def __len__(self):
+        return self._size
+
+    def tier_of(self, client):
+        for i, tier in enumerate(self.tiers):
+            if tier(client):
+                return i
+        return len(self.tiers)
+
+    def push(self, client):
+        if not isinstance(client, Client):
+            raise TypeError("client must be instance of Client")
+
+        entry = [self.tier_of(client), -client.cargo_weight, next(self._seq), client]
+        heapq.heappush(self._heap, entry)
+        self._entries.setdefault(client, []).append(entry)
+        self._size += 1
+        self._order = None
+
+    def cancel(self, client):
+        entries = self._entries.get(client)
+        if not entries:
+            return False
+
+        entry = entries.pop()
+        if not entries:
+            del self._entries[client]
+
+        # Ленивое удаление: запись помечается пустой и выбрасывается
+        # при следующем построении порядка
+        entry[3] = None
+        self._dead += 1
+        self._size -= 1
+        self._order = None
+        return True
+
+    def ordered(self):
+        if self._order is None:
+            arrivals = []
+            while self._heap:
+                entry = heapq.heappop(self._heap)
+                if entry[3] is not None:
+                    arrivals.append(entry)
+
+            if self._dead:
+                self._settled = [entry for entry in self._settled if entry[3] is not None]
+                self._settled_clients = [entry[3] for entry in self._settled]
+                self._dead = 0
+
+            if len(arrivals) <= 32:
+                for entry in arrivals:
+                    pos = bisect_right(self._settled, entry)
+                    self._settled.insert(pos, entry)
+                    self._settled_clients.insert(pos, entry[3])
+            else:
+                self._merge(arrivals)
+
+            self._order = tuple(self._settled_clients)
+        return self._order
+
+    def _merge(self, arrivals):
+        settled = self._settled
+        clients = self._settled_clients
+
+        # Новые заявки вставляются в уже упорядоченную часть по позициям
+        # бинарного поиска, так что повторный расчёт не сортирует всю базу
+        merged = []
+        merged_clients = []
+        prev = 0
+        for entry in arrivals:
+            pos = bisect_right(settled, entry, prev)
+            merged.extend(settled[prev:pos])
+            merged.append(entry)
+            merged_clients.extend(clients[prev:pos])
+            merged_clients.append(entry[3])
+            prev = pos
+        merged.extend(settled[prev:])
+        merged_clients.extend(clients[prev:])
+
+        self._settled = merged
+        self._settled_clients = merged_clients
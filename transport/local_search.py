@@ -0,0 +1,221 @@
+import random
+import time
+
+from .vehicle import Vehicle
+from .distribution_result import DistributionResult
+
+
+class ImprovementReport:
+    def __init__(self, vehicles_before, vehicles_after, elapsed, iterations):
+        self.vehicles_before = vehicles_before
+        self.vehicles_after = vehicles_after
+        self.elapsed = elapsed
+        self.iterations = iterations
+
+    @property
+    def vehicles_removed(self):
+        return self.vehicles_before - self.vehicles_after
+
+    def __str__(self):
+        return (
+            f"Vehicles removed: {self.vehicles_removed} "
+            f"({self.vehicles_before} -> {self.vehicles_after})\n"
+            f"Elapsed: {self.elapsed:.3f} s\n"
+            f"Iterations: {self.iterations}"
+        )
+
+
+class _Assignment:
+    def __init__(self, capacity, bins, base):
+        self.capacity = capacity
+        self.bins = bins
+        self.base = base
+        self.load = [b + sum(c.cargo_weight for c in clients) for b, clients in zip(base, bins)]
+        self.log = []
+
+    def free(self, i):
+        return self.capacity[i] - self.load[i]
+
+    def used(self):
+        return [i for i in range(len(self.bins)) if self.bins[i] or self.base[i] > 0]
+
+    def move(self, client, src, dst):
+        self.bins[src].remove(client)
+        self.bins[dst].append(client)
+        self.load[src] -= client.cargo_weight
+        self.load[dst] += client.cargo_weight
+        self.log.append((client, src, dst))
+
+    def rollback(self, mark):
+        while len(self.log) > mark:
+            client, src, dst = self.log.pop()
+            self.bins[dst].remove(client)
+            self.bins[src].append(client)
+            self.load[dst] -= client.cargo_weight
+            self.load[src] += client.cargo_weight
+
+    def snapshot(self):
+        return [list(b) for b in self.bins]
+
+
+def _best_fit(state, weight, candidates, exclude):
+    best = None
+    for i in candidates:
+        if i in exclude:
+            continue
+        free = state.free(i)
+        if free >= weight and (best is None or free < state.free(best)):
+            best = i
+    return best
+
+
+def _eject(state, client, target, candidates):
+    # Цепочка вытеснения: освободить место в v, переложив один груз e в u
+    for v in candidates:
+        if v == target:
+            continue
+        need = client.cargo_weight - state.free(v)
+        if need <= 0:
+            continue
+        for ejected in sorted(state.bins[v], key=lambda c: c.cargo_weight):
+            if ejected.cargo_weight < need:
+                continue
+            if ejected.cargo_weight >= client.cargo_weight:
+                break
+            u = _best_fit(state, ejected.cargo_weight, candidates, (target, v))
+            if u is not None:
+                state.move(ejected, v, u)
+                return v
+    return None
+
+
+def _try_empty(state, target, candidates, deadline):
+    mark = len(state.log)
+    for client in sorted(state.bins[target], key=lambda c: -c.cargo_weight):
+        if time.perf_counter() > deadline:
+            state.rollback(mark)
+            return False
+
+        dst = _best_fit(state, client.cargo_weight, candidates, (target,))
+        if dst is None:
+            dst = _eject(state, client, target, candidates)
+        if dst is None:
+            state.rollback(mark)
+            return False
+        state.move(client, target, dst)
+    return True
+
+
+def _perturb(state, rng, attempts):
+    used = [i for i in state.used() if state.bins[i]]
+    if len(used) < 2:
+        return
+
+    for _ in range(attempts):
+        a, b = rng.sample(used, 2)
+        if not state.bins[a] or not state.bins[b]:
+            continue
+        x = rng.choice(state.bins[a])
+        y = rng.choice(state.bins[b])
+
+        if state.load[a] <= state.load[b] and x.cargo_weight <= state.free(b):
+            state.move(x, a, b)
+            continue
+
+        delta = x.cargo_weight - y.cargo_weight
+        if delta <= state.free(b) and -delta <= state.free(a):
+            state.move(x, a, b)
+            state.move(y, b, a)
+
+
+def _lower_bound(state):
+    remaining = sum(state.load)
+    count = 0
+    for capacity in sorted(state.capacity, reverse=True):
+        if remaining <= 0:
+            break
+        remaining -= capacity
+        count += 1
+    return count
+
+
+def _check_budget(time_budget):
+    if not isinstance(time_budget, (int, float)):
+        raise TypeError("time_budget must be number")
+
+    if time_budget < 0:
+        raise ValueError("time_budget must be >= 0")
+
+
+def _search(state, time_budget, seed, max_idle_rounds):
+    start = time.perf_counter()
+    deadline = start + time_budget
+    rng = random.Random(seed)
+
+    before = len(state.used())
+    best_used = before
+    best = state.snapshot()
+    bound = _lower_bound(state)
+
+    iterations = 0
+    idle = 0
+    while best_used > bound and idle <= max_idle_rounds and time.perf_counter() < deadline:
+        iterations += 1
+        state.log.clear()
+        used = state.used()
+
+        closed = False
+        for target in sorted(used, key=lambda i: state.load[i]):
+            if state.base[target] > 0:
+                continue
+            if _try_empty(state, target, used, deadline):
+                closed = True
+                break
+
+        if closed and len(state.used()) < best_used:
+            best_used = len(state.used())
+            best = state.snapshot()
+            idle = 0
+            continue
+
+        idle += 1
+        _perturb(state, rng, len(used))
+
+    return best, ImprovementReport(before, best_used, time.perf_counter() - start, iterations)
+
+
+def improve_distribution(vehicles, time_budget=1.0, seed=None, max_idle_rounds=50):
+    if not isinstance(vehicles, (list, tuple)):
+        raise TypeError("vehicles must be a list or tuple")
+
+    for vehicle in vehicles:
+        if not isinstance(vehicle, Vehicle):
+            raise TypeError("vehicles must contain Vehicle instances")
+
+    _check_budget(time_budget)
+
+    base = [v.base_load() for v in vehicles]
+    state = _Assignment([v.capacity for v in vehicles], [list(v.clients_list) for v in vehicles], base)
+    best, report = _search(state, time_budget, seed, max_idle_rounds)
+
+    for vehicle, clients, b in zip(vehicles, best, base):
+        vehicle.clients_list = clients
+        vehicle.current_load = b + sum(c.cargo_weight for c in clients)
+
+    return report
+
+
+def improve_result(result, time_budget=1.0, seed=None, max_idle_rounds=50):
+    if not isinstance(result, DistributionResult):
+        raise TypeError("result must be instance of DistributionResult")
+
+    _check_budget(time_budget)
+
+    vehicles = result.vehicles
+    bins = [result.vehicle_clients(v) for v in range(len(vehicles))]
+    state = _Assignment([v.capacity for v in vehicles], bins, list(result.base_loads))
+    best, report = _search(state, time_budget, seed, max_idle_rounds)
+
+    improved = DistributionResult.from_bins(result.clients, vehicles, best, result.base_loads)
+    improved.improvement = report
+    return improved
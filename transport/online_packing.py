@@ -0,0 +1,98 @@
+from bisect import bisect_left, insort
+
+from .client import Client
+from .vehicle import Vehicle, CapacityOverloadError
+
+
+class PlacementEvent:
+    def __init__(self, client, vehicle):
+        self.client = client
+        self.vehicle = vehicle
+
+    @property
+    def placed(self):
+        return self.vehicle is not None
+
+    def __str__(self):
+        if self.vehicle is None:
+            return f"{self.client.name} -> rejected"
+        return f"{self.client.name} -> {self.vehicle.vehicle_id}"
+
+
+class OnlinePacker:
+    def __init__(self, vehicles, vip_reserve=0.0):
+        if not isinstance(vehicles, (list, tuple)):
+            raise TypeError("vehicles must be a list or tuple")
+
+        for vehicle in vehicles:
+            if not isinstance(vehicle, Vehicle):
+                raise TypeError("vehicles must contain Vehicle instances")
+
+        if not isinstance(vip_reserve, (int, float)):
+            raise TypeError("vip_reserve must be number")
+
+        if not 0 <= vip_reserve < 1:
+            raise ValueError("vip_reserve must be in [0, 1)")
+
+        self.vehicles = list(vehicles)
+        self.reserve = [v.capacity * vip_reserve for v in self.vehicles]
+        self.placed_weight = 0
+        self.rejected = 0
+
+        # Best-Fit: отсортированные индексы свободного места. VIP может
+        # занимать весь остаток, обычный клиент — только сверх резерва
+        self._free = [v.capacity - v.current_load for v in self.vehicles]
+        self._vip_index = sorted((free, i) for i, free in enumerate(self._free))
+        self._regular_index = sorted((free - self.reserve[i], i) for i, free in enumerate(self._free))
+
+    def place(self, client):
+        if not isinstance(client, Client):
+            raise TypeError("client must be instance of Client")
+
+        index = self._vip_index if client.is_vip else self._regular_index
+        pos = bisect_left(index, (client.cargo_weight, -1))
+
+        while pos < len(index):
+            i = index[pos][1]
+            vehicle = self.vehicles[i]
+            try:
+                vehicle.load_cargo(client)
+            except CapacityOverloadError:
+                pos += 1
+                continue
+
+            self._update(i)
+            self.placed_weight += client.cargo_weight
+            return PlacementEvent(client, vehicle)
+
+        self.rejected += 1
+        return PlacementEvent(client, None)
+
+    def _update(self, i):
+        old = self._free[i]
+        vehicle = self.vehicles[i]
+        new = vehicle.capacity - vehicle.current_load
+        self._free[i] = new
+
+        for index, shift in ((self._vip_index, 0), (self._regular_index, self.reserve[i])):
+            del index[bisect_left(index, (old - shift, i))]
+            insort(index, (new - shift, i))
+
+    def vehicles_used(self):
+        return sum(1 for v in self.vehicles if v.clients_list)
+
+    def offline_lower_bound(self):
+        remaining = self.placed_weight
+        count = 0
+        for capacity in sorted((v.capacity for v in self.vehicles), reverse=True):
+            if remaining <= 0:
+                break
+            remaining -= capacity
+            count += 1
+        return count
+
+    def competitive_ratio(self):
+        bound = self.offline_lower_bound()
+        if bound == 0:
+            return 1.0
+        return self.vehicles_used() / bound
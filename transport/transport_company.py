@@ -1,9 +1,15 @@
-from .vehicle import Vehicle, CapacityOverloadError
+from array import array
+
+from .vehicle import Vehicle
 from .client import Client
+from .online_packing import OnlinePacker
+from .local_search import improve_result
+from .distribution_result import DistributionResult
+from .intake_queue import IntakeQueue
 
 
 class TransportCompany:
-    def __init__(self, name, vehicles=None, clients=None):
+    def __init__(self, name, vehicles=None, clients=None, priority_tiers=None):
         if not isinstance(name, str):
             raise TypeError("name must be a string")
 
@@ -15,7 +21,24 @@ class TransportCompany:
 
         self.name = name
         self.vehicles = list(vehicles) if vehicles else []
-        self.clients = list(clients) if clients else []
+        self._clients = []
+        self._clients_view = None
+        self.intake = IntakeQueue(priority_tiers)
+        if clients:
+            self.add_clients(clients)
+
+    @property
+    def clients(self):
+        # Только для чтения: список меняется лишь через методы компании,
+        # которые одновременно обновляют очередь приёма
+        if self._clients_view is None:
+            self._clients_view = tuple(self._clients)
+        return self._clients_view
+
+    def set_priority_tiers(self, priority_tiers):
+        self.intake = IntakeQueue(priority_tiers)
+        for client in self._clients:
+            self.intake.push(client)
 
     def add_vehicle(self, vehicle):
         if not isinstance(vehicle, Vehicle):
@@ -23,6 +46,14 @@ class TransportCompany:
 
         self.vehicles.append(vehicle)
 
+    def add_vehicles(self, vehicles):
+        vehicles = list(vehicles)
+        for vehicle in vehicles:
+            if not isinstance(vehicle, Vehicle):
+                raise TypeError("vehicle must be instance of Vehicle")
+
+        self.vehicles.extend(vehicles)
+
     def list_vehicles(self):
         return self.vehicles
 
@@ -30,43 +61,87 @@ class TransportCompany:
         if not isinstance(client, Client):
             raise TypeError("client must be instance of Client")
 
-        self.clients.append(client)
+        self._clients.append(client)
+        self._clients_view = None
+        self.intake.push(client)
+
+    def add_clients(self, clients):
+        clients = list(clients)
+        for client in clients:
+            if not isinstance(client, Client):
+                raise TypeError("client must be instance of Client")
+
+        self._clients.extend(clients)
+        self._clients_view = None
+        for client in clients:
+            self.intake.push(client)
 
     def remove_client(self, client):
-        if client in self.clients:
-            self.clients.remove(client)
-        
+        if client in self._clients:
+            self._clients.remove(client)
+            self._clients_view = None
+            self.intake.cancel(client)
+
         for vehicle in self.vehicles:
             if client in vehicle.clients_list:
                 vehicle.clients_list.remove(client)
                 vehicle.current_load -= client.cargo_weight
 
+    def replace_client(self, old, new):
+        if not isinstance(new, Client):
+            raise TypeError("client must be instance of Client")
+
+        idx = self._clients.index(old)
+        self.remove_client(old)
+        self._clients.insert(idx, new)
+        self._clients_view = None
+        self.intake.push(new)
+
     def remove_vehicle(self, vehicle):
         if vehicle in self.vehicles:
             self.vehicles.remove(vehicle)
 
 
-    def optimize_cargo_distribution(self):
-        sorted_clients = sorted(
-            self.clients,
-            key=lambda c: not c.is_vip
-        )
-
-        sorted_vehicles = sorted(
-            self.vehicles,
-            key=lambda v: v.capacity
-        )
-
-        for client in sorted_clients:
-            loaded = False
-
-            for vehicle in sorted_vehicles:
-                try:
-                    vehicle.load_cargo(client)
-                    loaded = True
+    def optimize_cargo_distribution(self, improve=False, time_budget=1.0, apply=True):
+        clients = self.intake.ordered()
+        order = sorted(range(len(self.vehicles)), key=lambda v: self.vehicles[v].capacity)
+        capacity = [v.capacity for v in self.vehicles]
+        # Груз, лежавший в транспорте помимо клиентов, сохраняется как базовая загрузка
+        base = [v.base_load() for v in self.vehicles]
+        load = list(base)
+        assignment = array('l', [-1]) * len(clients)
+
+        for i, client in enumerate(clients):
+            for v in order:
+                if client.cargo_weight + load[v] <= capacity[v]:
+                    load[v] += client.cargo_weight
+                    assignment[i] = v
                     break
-                except CapacityOverloadError:
-                    continue
-
-            if not loaded:
+            else:
                 print(f"Не удалось загрузить клиента {client.name}: груз слишком большой")
+
+        result = DistributionResult(clients, self.vehicles, assignment, base)
+        if improve:
+            result = improve_result(result, time_budget)
+
+        if apply:
+            result.apply()
+        return result
+
+    def stream_cargo_distribution(self, clients, vip_reserve=0.0, record=False):
+        # По умолчанию поток не попадает в книгу клиентов и очередь приёма,
+        # чтобы состояние онлайн-режима оставалось ограниченным
+        packer = OnlinePacker(self.vehicles, vip_reserve)
+        for client in clients:
+            event = packer.place(client)
+            if record:
+                self.add_client(client)
+            yield event
+
+    async def astream_cargo_distribution(self, clients, vip_reserve=0.0, record=False):
+        packer = OnlinePacker(self.vehicles, vip_reserve)
+        async for client in clients:
+            event = packer.place(client)
+            if record:
+                self.add_client(client)
+            yield event
@@ -0,0 +1,32 @@
+import re
+
+
+def validate_name(name: str) -> bool:
+    if not isinstance(name, str):
+        return False
+    name = name.strip()
+    if len(name) < 2:
+        return False
+    if not re.match(r'^[A-Za-zА-Яа-яЁё\-\s]+$', name):
+        return False
+    return True
+
+
+def validate_weight(w: str) -> tuple[bool, float]:
+    try:
+        val = float(w)
+    except Exception:
+        return False, 0.0
+    if val <= 0 or val > 10000:
+        return False, val
+    return True, val
+
+
+def validate_capacity(c: str) -> tuple[bool, float]:
+    try:
+        val = float(c)
+    except Exception:
+        return False, 0.0
+    if val < 0:
+        return False, val
+    return True, val
@@ -2,6 +2,9 @@ import uuid
 from .client import Client
 
 
+BASE_LOAD_EPSILON = 1e-9
+
+
 class CapacityOverloadError(Exception):
     pass
 
@@ -41,6 +44,14 @@ class Vehicle:
         self.current_load += client.cargo_weight
         self.clients_list.append(client)
 
+    def base_load(self):
+        # Груз сверх перечисленных клиентов. Остаток округления после
+        # remove_client и отрицательная разница считаются нулём
+        base = self.current_load - sum(c.cargo_weight for c in self.clients_list)
+        if base <= BASE_LOAD_EPSILON * max(1, self.capacity):
+            return 0
+        return base
+
     def __str__(self):
         return (
             f"ID: {self.vehicle_id}\n"